@@ -28,7 +28,6 @@
 # -------------------------------------------------------------------------------
 # pylint: disable=missing-docstring,arguments-differ
 
-import json
 from os.path import basename
 
 import requests
@@ -132,7 +131,7 @@ class DataUpload:
                 f"{response.status_code} {response.reason}: {response.text}"
             )
 
-        return json.loads(response.text)
+        return response.json()
 
     def get_constant_parameters(self, identifier):
         """Get dictionary of the currently set constant parameters."""
@@ -165,14 +164,12 @@ class DataUpload:
         Update metadata of the uploaded dataset.
         """
         url = self.url + (identifier or "")
-        headers = {"Content-Type": "application/json"}
-        headers.update(self.headers)
-        response = requests.patch(url, data=json.dumps(data), headers=headers)
+        response = requests.patch(url, json=data, headers=self.headers)
         if response.status_code != 200:
             raise self.Error(
                 f"{response.status_code} {response.reason}: {response.text}"
             )
-        return json.loads(response.text)
+        return response.json()
 
     def get(self, identifier=None):
         """REST/API GET
@@ -185,7 +182,7 @@ class DataUpload:
             raise self.Error(
                 f"{response.status_code} {response.reason}: {response.text}"
             )
-        return json.loads(response.text)
+        return response.json()
 
     def delete(self, identifier):
         """REST/API DELETE request.
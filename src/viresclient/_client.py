@@ -27,11 +27,17 @@
 # THE SOFTWARE.
 # -------------------------------------------------------------------------------
 
+import asyncio
+import copy
 import importlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
+from functools import partial
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, getLogger
+from threading import BoundedSemaphore
+from time import monotonic
 
 # Identify whether code is running in Jupyter notebook or not
 try:
@@ -54,7 +60,7 @@ from ._config import ClientConfig, set_token
 from ._data_handling import ReturnedData
 
 # from jinja2 import Environment, FileSystemLoader
-from ._wps.environment import JINJA2_ENVIRONMENT
+from ._wps.environment import get_template
 from ._wps.http_util import encode_basic_auth, encode_no_auth, encode_token_auth
 from ._wps.log_util import set_stream_handler
 from ._wps.time_util import parse_datetime, parse_duration
@@ -86,6 +92,12 @@ CONFIG_FILE_PATH = os.path.join(os.path.expanduser("~"), ".viresclient,ini")
 # Maximum time-chunk size ~25 years
 MAX_CHUNK_DURATION = timedelta(days=25 * 365.25)
 
+# Maximum number of asynchronous jobs the server runs at one time per user
+MAX_ASYNC_JOBS = 2
+
+# Free asynchronous job slots shared by all request objects
+ASYNC_JOB_SLOTS = BoundedSemaphore(MAX_ASYNC_JOBS)
+
 TEMPLATE_FILES = {
     "list_jobs": "vires_list_jobs.xml",
     "getTimeData": "vires_getTimeData.xml",
@@ -139,21 +151,31 @@ class WPSInputs:
             templatefile (str): Name of the xml template file
 
         """
-        template = JINJA2_ENVIRONMENT.get_template(templatefile)
-        request = template.render(**self.as_dict).encode("UTF-8")
+        # NOTE: The dictionary is passed as is, avoiding an extra copy
+        #       made by the keyword arguments unpacking.
+        template = get_template(templatefile)
+        request = template.render(self.as_dict).encode("UTF-8")
         return request
 
 
 class ProgressBar:
     """Custom tqdm status bar"""
 
+    # minimum time in seconds between two progress bar refreshes
+    MIN_REFRESH_INTERVAL = 0.1
+
     def __init__(self, bar_format, total=100, leave=True):
         self.percentCompleted = 0
         self.lastpercent = 0
+        self._last_refresh_time = 0.0
         self.tqdm_pbar = tqdm(
             total=total,
             bar_format=bar_format,
             leave=leave,
+            mininterval=self.MIN_REFRESH_INTERVAL,
+            miniters=1,
+            # disabled for non-TTY outputs, except in notebooks
+            disable=False if IN_JUPYTER else None,
         )
 
     def __enter__(self):
@@ -166,10 +188,21 @@ class ProgressBar:
         self.tqdm_pbar.close()
 
     def refresh_tqdm(self):
-        """Updates the output of the progress bar."""
+        """Updates the output of the progress bar.
+        The updates are skipped if they come too frequently, except for
+        the final one.
+        """
         if self.percentCompleted is None:
             return
+        time_ = monotonic()
+        if (
+            self.percentCompleted != 100
+            and time_ - self._last_refresh_time < self.MIN_REFRESH_INTERVAL
+        ):
+            return
+        self._last_refresh_time = time_
         self.tqdm_pbar.update(self.percentCompleted - self.lastpercent)
+        self.lastpercent = self.percentCompleted
         if self.percentCompleted == 100:
             self.cleanup()
 
@@ -216,7 +249,6 @@ class ProgressBarProcessing(ProgressBar):
 
     def update(self, wpsstatus):
         """Updates the internal state based on the state of a WPSStatus object."""
-        self.lastpercent = self.percentCompleted
         self.percentCompleted = wpsstatus.percentCompleted
         if self.lastpercent != self.percentCompleted:
             self.refresh_tqdm()
@@ -244,7 +276,6 @@ class ProgressBarDownloading(ProgressBar):
 
     def update(self, percentCompleted):
         """Updates the internal state of the percentage completion."""
-        self.lastpercent = self.percentCompleted
         self.percentCompleted = percentCompleted
         if self.lastpercent != self.percentCompleted:
             self.refresh_tqdm()
@@ -260,8 +291,10 @@ class ClientRequest:
         config=None,
         logging_level="NO_LOGGING",
         server_type=None,
+        session=None,
     ):
         self._server_type = server_type
+        self._session = session
 
         # Check and prompt for token if not already set, then store in config
         # Try to only do this if running in a notebook
@@ -339,7 +372,10 @@ class ClientRequest:
 
         # service proxy with authentication
         return ViresWPS10Service(
-            url, encode_headers(**credentials), logger=self._logger
+            url,
+            encode_headers(**credentials),
+            logger=self._logger,
+            session=self._session,
         )
 
     @staticmethod
@@ -366,19 +402,20 @@ class ClientRequest:
         with a download progress bar
         """
 
-        def copyfileobj(fsrc, fdst, callback=None, total=None, length=16 * 1024):
+        def copyfileobj(fsrc, fdst, callback=None, total=None, length=1024 * 1024):
             """Copying with progress reporting
             https://stackoverflow.com/a/29967714
+
+            The progress is reported as the number of bytes received,
+            i.e., before the content decoding (decompression).
             """
-            copied = 0
             while True:
                 buf = fsrc.read(length)
                 if not buf:
                     break
                 fdst.write(buf)
-                copied += len(buf)
                 if callback:
-                    callback(copied=copied, total=total)
+                    callback(copied=fsrc.tell(), total=total)
 
         def copy_progress(pbar):
             def _copy_progress(copied, total):
@@ -389,21 +426,24 @@ class ClientRequest:
         def write_response(file_obj):
             """Acts on a file object to copy it to another file
             https://stackoverflow.com/a/7244263
-            file_obj is what is returned from urllib.urlopen()
+            file_obj is the raw (urllib3) HTTP response
             """
-            size = int(file_obj.info()["Content-Length"])
-            self._downloaded_chunk_sizes.append(size)
+            size = file_obj.info().get("Content-Length")
+            if size is None:
+                # unknown size (chunked transfer encoding) - no progress
+                return write_response_without_reporting(file_obj)
+            size = int(size)
             with ProgressBarDownloading(size, leave=leave_progress_bar) as pbar:
                 with open(retdatafile._file.name, "wb") as out_file:
                     copyfileobj(
                         file_obj, out_file, callback=copy_progress(pbar), total=size
                     )
+            self._downloaded_chunk_sizes.append(file_obj.tell())
 
         def write_response_without_reporting(file_obj):
-            size = int(file_obj.info()["Content-Length"])
-            self._downloaded_chunk_sizes.append(size)
             with open(retdatafile._file.name, "wb") as out_file:
                 copyfileobj(file_obj, out_file)
+            self._downloaded_chunk_sizes.append(file_obj.tell())
 
         if show_progress:
             return write_response
@@ -474,19 +514,21 @@ class ClientRequest:
         """
         try:
             if asynchronous:
-                if show_progress:
-                    with ProgressBarProcessing(
-                        message, leave=leave_progress_bar
-                    ) as progressbar:
+                # wait for a free asynchronous job slot
+                with ASYNC_JOB_SLOTS:
+                    if show_progress:
+                        with ProgressBarProcessing(
+                            message, leave=leave_progress_bar
+                        ) as progressbar:
+                            return self._wps_service.retrieve_async(
+                                request,
+                                handler=response_handler,
+                                status_handler=progressbar.update,
+                            )
+                    else:
                         return self._wps_service.retrieve_async(
-                            request,
-                            handler=response_handler,
-                            status_handler=progressbar.update,
+                            request, handler=response_handler
                         )
-                else:
-                    return self._wps_service.retrieve_async(
-                        request, handler=response_handler
-                    )
             else:
                 return self._wps_service.retrieve(request, handler=response_handler)
         except WPSError:
@@ -545,15 +587,12 @@ class ClientRequest:
         if asynchronous not in [True, False]:
             raise TypeError("asynchronous must be set to either True or False")
 
-        # Initialise the ReturnedData so that filetype checking is done there
-        retdatagroup = ReturnedData(
-            filetype=filetype,
-            file_options=self._file_options,
-        )
-
-        if retdatagroup.filetype not in self._supported_filetypes:
+        # Check the filetype before any temporary file is created
+        if not isinstance(filetype, str):
+            raise TypeError("filetype must be a string")
+        if filetype.lower() not in self._supported_filetypes:
             raise TypeError(f"filetype: {filetype} not supported by server")
-        self._request_inputs.response_type = RESPONSE_TYPES[retdatagroup.filetype]
+        self._request_inputs.response_type = RESPONSE_TYPES[filetype.lower()]
 
         if asynchronous:
             # asynchronous WPS request
@@ -648,6 +687,151 @@ class ClientRequest:
 
         return retdatagroup
 
+    async def get_between_async(
+        self,
+        start_time=None,
+        end_time=None,
+        filetype="cdf",
+        asynchronous=True,
+        nrecords_limit=None,
+        tmpdir=None,
+    ):
+        """Make the server request and download the data without blocking
+        the asyncio event loop.
+
+        The request is made in a worker thread on a snapshot of the current
+        request settings, so that multiple requests can be awaited
+        concurrently, e.g.::
+
+            data_list = await asyncio.gather(
+                request.get_between_async(start_1, end_1),
+                request.get_between_async(start_2, end_2),
+            )
+
+        The server runs only two asynchronous jobs at one time, therefore
+        at most two asynchronous jobs are submitted at once by all request
+        objects and the remaining requests wait for a free slot. No progress
+        bars are shown.
+
+        Args:
+            start_time (datetime / ISO_8601 string)
+            end_time (datetime / ISO_8601 string)
+            filetype (str): one of ('csv', 'cdf')
+            asynchronous (bool): True for asynchronous processing,
+                False for synchronous
+            nrecords_limit (int): Override the default limit per request
+                (e.g. nrecords_limit=3456000)
+            tmpdir (str): Override the default temporary file directory
+
+        Returns:
+            ReturnedData:
+        """
+        get_between = partial(
+            self._copy_request().get_between,
+            start_time=start_time,
+            end_time=end_time,
+            filetype=filetype,
+            asynchronous=asynchronous,
+            show_progress=False,
+            show_progress_chunks=False,
+            nrecords_limit=nrecords_limit,
+            tmpdir=tmpdir,
+        )
+        return await asyncio.get_running_loop().run_in_executor(None, get_between)
+
+    def get_many(
+        self,
+        intervals,
+        filetype="cdf",
+        asynchronous=True,
+        show_progress=True,
+        max_concurrency=MAX_ASYNC_JOBS,
+        nrecords_limit=None,
+        tmpdir=None,
+    ):
+        """Make the server requests for multiple time intervals concurrently
+        and download the data.
+
+        The requests are processed in up to max_concurrency parallel WPS jobs
+        instead of one after another. As the server runs only two
+        asynchronous jobs at one time, max_concurrency is capped
+        to two for the asynchronous requests.
+
+        Args:
+            intervals (list): list of (start_time, end_time) pairs
+                (datetime / ISO_8601 string)
+            filetype (str): one of ('csv', 'cdf')
+            asynchronous (bool): True for asynchronous processing,
+                False for synchronous
+            show_progress (bool): Set to False to remove the progress bar
+            max_concurrency (int): Maximum number of parallel requests
+                (at most 2 for asynchronous processing)
+            nrecords_limit (int): Override the default limit per request
+                (e.g. nrecords_limit=3456000)
+            tmpdir (str): Override the default temporary file directory
+
+        Returns:
+            ReturnedData: data of all intervals, in the order of the intervals
+        """
+        intervals = list(intervals)
+        if not intervals:
+            raise ValueError("At least one time interval must be provided!")
+        nintervals = len(intervals)
+        if asynchronous:
+            max_concurrency = min(max_concurrency, MAX_ASYNC_JOBS)
+
+        def _get_interval(start_time, end_time):
+            """Get data of one interval and the number of received bytes."""
+            request = self._copy_request()
+            retdata = request.get_between(
+                start_time=start_time,
+                end_time=end_time,
+                filetype=filetype,
+                asynchronous=asynchronous,
+                show_progress=False,
+                show_progress_chunks=False,
+                nrecords_limit=nrecords_limit,
+                tmpdir=tmpdir,
+            )
+            return retdata, sum(request._downloaded_chunk_sizes)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(_get_interval, start_time, end_time)
+                for start_time, end_time in intervals
+            ]
+            try:
+                if show_progress:
+                    with ProgressBarChunks(nintervals) as pbar:
+                        totalsize = 0
+                        for i, future in enumerate(as_completed(futures)):
+                            pbar.update(i, nintervals, totalsize)
+                            totalsize += future.result()[1]
+                        pbar.update(i, nintervals, totalsize, final=True)
+                results = [future.result()[0] for future in futures]
+            except BaseException:
+                # do not wait for the pending requests
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # join the downloaded files in the order of the requested intervals
+        retdatagroup = results[0]
+        retdatagroup.contents = [
+            retdatafile for retdata in results for retdatafile in retdata.contents
+        ]
+        return retdatagroup
+
+    def _copy_request(self):
+        """Create a copy of the request object which can be used independently
+        of the original one. The WPS service proxy (and its HTTP session)
+        is shared.
+        """
+        request = copy.copy(self)
+        request._request_inputs = copy.deepcopy(self._request_inputs)
+        request._downloaded_chunk_sizes = []
+        return request
+
     def list_jobs(self):
         """Return job information from the server.
 
@@ -655,7 +839,7 @@ class ClientRequest:
             dict
         """
         templatefile = TEMPLATE_FILES["list_jobs"]
-        template = JINJA2_ENVIRONMENT.get_template(templatefile)
+        template = get_template(templatefile)
         request = template.render().encode("UTF-8")
         response = self._get(request, asynchronous=False, show_progress=False)
         return json.loads(response.decode("UTF-8"))
@@ -672,7 +856,7 @@ class ClientRequest:
             DataFrame
 
         """
-        template = JINJA2_ENVIRONMENT.get_template(TEMPLATE_FILES["getTimeData"])
+        template = get_template(TEMPLATE_FILES["getTimeData"])
         request = template.render(
             collection_id=collection, begin_time=start_time, end_time=end_time
         ).encode("UTF-8")
@@ -219,11 +219,22 @@ class AeolusRequest(ClientRequest):
         token (str):
         config (str or ClientConfig):
         logging_level (str):
+        session (requests.Session): HTTP session to be shared with other
+            requests (optional)
 
     """
 
-    def __init__(self, url=None, token=None, config=None, logging_level="NO_LOGGING"):
-        super().__init__(url, token, config, logging_level, server_type="Aeolus")
+    def __init__(
+        self,
+        url=None,
+        token=None,
+        config=None,
+        logging_level="NO_LOGGING",
+        session=None,
+    ):
+        super().__init__(
+            url, token, config, logging_level, server_type="Aeolus", session=session
+        )
         # self._available = self._set_available_data()
         self._request_inputs = AeolusWPSInputs()
         self._request_inputs.processId = "aeolus:level1B"
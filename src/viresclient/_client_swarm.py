@@ -15,7 +15,7 @@ from tqdm import tqdm
 from ._client import TEMPLATE_FILES, ClientRequest, WPSInputs
 from ._data import CONFIG_SWARM
 from ._data_handling import ReturnedDataFile
-from ._wps.environment import JINJA2_ENVIRONMENT
+from ._wps.environment import get_template
 from ._wps.time_util import parse_datetime
 
 TEMPLATE_FILES = {
@@ -461,6 +461,8 @@ class SwarmRequest(ClientRequest):
         token (str):
         config (str or ClientConfig):
         logging_level (str):
+        session (requests.Session): HTTP session to be shared with other
+            requests (optional)
 
     """
 
@@ -1344,8 +1346,17 @@ class SwarmRequest(ClientRequest):
         "SwarmCI",
     ]
 
-    def __init__(self, url=None, token=None, config=None, logging_level="NO_LOGGING"):
-        super().__init__(url, token, config, logging_level, server_type="Swarm")
+    def __init__(
+        self,
+        url=None,
+        token=None,
+        config=None,
+        logging_level="NO_LOGGING",
+        session=None,
+    ):
+        super().__init__(
+            url, token, config, logging_level, server_type="Swarm", session=session
+        )
 
         self._available = self._get_available_data()
         self._request_inputs = SwarmWPSInputs()
@@ -1608,7 +1619,7 @@ class SwarmRequest(ClientRequest):
         def _request_get_observatories(collection=None, start_time=None, end_time=None):
             """Make the get_observatories request to the server"""
             templatefile = TEMPLATE_FILES["get_observatories"]
-            template = JINJA2_ENVIRONMENT.get_template(templatefile)
+            template = get_template(templatefile)
             request = template.render(
                 collection_id=collection,
                 begin_time=start_time,
@@ -2060,7 +2071,7 @@ class SwarmRequest(ClientRequest):
         self._check_mission_spacecraft(mission, spacecraft)
 
         templatefile = TEMPLATE_FILES["times_from_orbits"]
-        template = JINJA2_ENVIRONMENT.get_template(templatefile)
+        template = get_template(templatefile)
         request = template.render(
             mission=mission,
             spacecraft=spacecraft,
@@ -2206,7 +2217,7 @@ class SwarmRequest(ClientRequest):
         def _request_get_model_info(model_expression=None, custom_shc=None):
             """Make the get_model_info request."""
             templatefile = TEMPLATE_FILES["model_info"]
-            template = JINJA2_ENVIRONMENT.get_template(templatefile)
+            template = get_template(templatefile)
             request = template.render(
                 model_expression=model_expression,
                 custom_shc=custom_shc,
@@ -2319,7 +2330,7 @@ class SwarmRequest(ClientRequest):
             )
 
         templatefile = TEMPLATE_FILES["get_conjunctions"]
-        template = JINJA2_ENVIRONMENT.get_template(templatefile)
+        template = get_template(templatefile)
         request = template.render(
             begin_time=start_time,
             end_time=end_time,
@@ -411,7 +411,15 @@ def make_pandas_DataFrame_from_csv(csv_filename, time_variable="Timestamp"):
     except Exception:
         raise Exception("Bad or empty csv.")
     # Convert to datetime objects
-    df[time_variable] = df[time_variable].apply(time_util.parse_datetime)
+    if len(df) != 0:
+        try:
+            # vectorised parsing, the time-zone aware times are converted to UTC
+            df[time_variable] = pandas.to_datetime(
+                df[time_variable], format="ISO8601", utc=True
+            ).dt.tz_localize(None)
+        except ValueError:
+            # older pandas versions not supporting format="ISO8601"
+            df[time_variable] = df[time_variable].apply(time_util.parse_datetime)
     # Convert the columns of vectors from strings to lists
     # Returns empty dataframe when retrieval from server is empty
     if len(df) != 0:
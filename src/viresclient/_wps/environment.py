@@ -27,6 +27,7 @@
 # -------------------------------------------------------------------------------
 
 import json
+from functools import lru_cache
 from os.path import dirname, join
 
 from jinja2 import Environment, FileSystemLoader
@@ -40,10 +41,25 @@ def wrap_as_cdata(content):
 
 _DIRNAME = dirname(__file__)
 _TEMPLATESDIR = join(_DIRNAME, "templates")
-JINJA2_ENVIRONMENT = Environment(loader=FileSystemLoader(_TEMPLATESDIR))
+# NOTE: The packaged templates do not change at runtime, there is no need
+#       to check their modification times and evict them from the cache.
+JINJA2_ENVIRONMENT = Environment(
+    loader=FileSystemLoader(_TEMPLATESDIR),
+    auto_reload=False,
+    cache_size=-1,
+)
 JINJA2_ENVIRONMENT.filters.update(
     d2s=lambda d: d.isoformat("T") + "Z",
     l2s=lambda l: ", ".join(str(v) for v in l),
     o2j=json.dumps,
     cdata=wrap_as_cdata,
 )
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """Get the template of the given name.
+    The loaded templates are memoized and the Jinja2 loader is called only
+    once per template.
+    """
+    return JINJA2_ENVIRONMENT.get_template(name)
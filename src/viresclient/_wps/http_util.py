@@ -27,6 +27,54 @@
 # -------------------------------------------------------------------------------
 
 from base64 import standard_b64encode
+from http.cookiejar import DefaultCookiePolicy
+
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
+from requests.auth import AuthBase
+
+# retry policy applied to the failed connections and the idempotent requests
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+
+def create_http_session(pool_connections=4, pool_maxsize=16):
+    """Create new HTTP session keeping persistent (pooled) connections
+    to the servers.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=HTTP_RETRY,
+    )
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # NOTE: The compressed responses are decoded by the WPS service proxy.
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    # NOTE: No cookies are stored so that they cannot be shared by service
+    #       proxies with different credentials.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+class HeadersAuth(AuthBase):
+    """Authentication setting the pre-encoded HTTP headers of a request.
+
+    Passing an explicit authentication prevents requests from looking up
+    the credentials in the user's ~/.netrc file.
+    """
+
+    def __init__(self, headers):
+        self.headers = headers
+
+    def __call__(self, request):
+        request.headers.update(self.headers)
+        return request
 
 
 def encode_no_auth(**kwargs):
@@ -29,9 +29,10 @@
 import math
 import re
 from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
 from time import time
 
-RE_ISO_8601_DATETIME_LONG = re.compile(
+_ISO_8601_DATETIME_LONG = (
     r"^(\d{4,4})-(\d{2,2})-(\d{2,2})(?:"
     r"T(\d{2,2}):(\d{2,2})"
     r"(?::(\d{2,2})(?:[.,](\d{0,6})\d*)?)?"
@@ -39,7 +40,7 @@ RE_ISO_8601_DATETIME_LONG = re.compile(
     r")?$"
 )
 
-RE_ISO_8601_DATETIME_SHORT = re.compile(
+_ISO_8601_DATETIME_SHORT = (
     r"^(\d{4,4})(\d{2,2})(\d{2,2})(?:"
     r"T(\d{2,2})(\d{2,2})"
     r"(?:(\d{2,2})(?:[.,](\d{0,6})\d*)?)?"
@@ -47,6 +48,18 @@ RE_ISO_8601_DATETIME_SHORT = re.compile(
     r")?$"
 )
 
+RE_ISO_8601_DATETIME_LONG = re.compile(_ISO_8601_DATETIME_LONG, re.ASCII)
+RE_ISO_8601_DATETIME_SHORT = re.compile(_ISO_8601_DATETIME_SHORT, re.ASCII)
+
+# both long and short formats matched at once
+# (groups 1-10 are set for the long and groups 11-20 for the short format)
+RE_ISO_8601_DATETIME = re.compile(
+    f"{_ISO_8601_DATETIME_LONG}|{_ISO_8601_DATETIME_SHORT}", re.ASCII
+)
+
+# lookup table of the two-digit date-time fields
+_TWO_DIGIT = {f"{i:02d}": i for i in range(100)}
+
 RE_ISO_8601_DURATION = re.compile(
     r"^(?P<sign>[+-])?P"
     r"(?:(?P<years>\d+(\.\d+)?)Y)?"
@@ -82,6 +95,19 @@ class TimeZone(tzinfo):
 UTC = TimeZone(ZERO, "UTC")
 
 
+@lru_cache(maxsize=128)
+def _get_time_zone(tz_hour, tz_min):
+    """Get time-zone object for the parsed signed hours and optional minutes
+    of the time-zone offset, e.g., ("+05", "30") or ("-01", None).
+    The sign of the hours applies to the minutes as well.
+    The time-zone objects are cached and shared by the parsed values.
+    """
+    return TimeZone(
+        timedelta(hours=int(tz_hour), minutes=int(tz_hour[0] + (tz_min or "0"))),
+        "{}:{}".format(tz_hour, tz_min or "00"),
+    )
+
+
 def now():
     """Get current UTC timestamp."""
     return datetime.utcnow()
@@ -101,19 +127,60 @@ def to_utc_naive(value):
     return value
 
 
+def _parse_datetime_fast(value):
+    """Parse the common `YYYY-MM-DDThh:mm:ss[.ffffff]Z` UTC date-time format
+    without the regular expression matching.
+    Returns `None` if the value is not in this format.
+    """
+    size = len(value)
+    if size == 20:
+        digits = value[0:4]
+    elif size == 27 and value[19] in ".,":
+        digits = value[0:4] + value[20:26]
+    else:
+        return None
+    if not (
+        value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[-1] == "Z"
+        and digits.isdecimal()
+        and digits.isascii()
+    ):
+        return None
+    try:
+        return datetime(
+            int(value[0:4]),
+            _TWO_DIGIT[value[5:7]],
+            _TWO_DIGIT[value[8:10]],
+            _TWO_DIGIT[value[11:13]],
+            _TWO_DIGIT[value[14:16]],
+            _TWO_DIGIT[value[17:19]],
+            int(value[20:26]) if size == 27 else 0,
+        )
+    except KeyError:
+        return None
+
+
 def parse_datetime(value, tz_local=None):
     """Parse an ISO 8601 date-time value. The parser supports time-zones and
     both long and short formats.
     Raises a `ValueError` if the conversion was not possible.
     """
     if not isinstance(value, datetime):
-        for pattern in (RE_ISO_8601_DATETIME_LONG, RE_ISO_8601_DATETIME_SHORT):
-            match = pattern.match(value)
-            if match:
-                break
-        else:
+        parsed_value = _parse_datetime_fast(value)
+        if parsed_value is not None:
+            return parsed_value
+
+        match = RE_ISO_8601_DATETIME.match(value)
+        if not match:
             raise ValueError("Invalid date-time input!")
 
+        groups = match.groups()
+        groups = groups[:10] if groups[0] is not None else groups[10:]
+
         (
             year,
             month,
@@ -125,34 +192,21 @@ def parse_datetime(value, tz_local=None):
             tzone,
             tz_hour,
             tz_min,
-        ) = match.groups()
+        ) = groups
 
         if tzone:
-            if tzone == "Z":
-                tz_obj = UTC
-            else:
-                tz_obj = (
-                    UTC
-                    if tzone == "Z"
-                    else TimeZone(
-                        timedelta(
-                            hours=int(tz_hour or 0),
-                            minutes=int(tz_hour[0] + (tz_min or "0")),
-                        ),
-                        "{}:{}".format(tz_hour, tz_min or "00"),
-                    )
-                )
+            tz_obj = UTC if tzone == "Z" else _get_time_zone(tz_hour, tz_min)
         else:
             tz_obj = tz_local
 
         value = datetime(
             int(year),
-            int(month),
-            int(day or 0),
-            int(hour or 0),
-            int(minute or 0),
-            int(sec or 0),
-            int(((usec or "") + "000000")[:6]),
+            _TWO_DIGIT[month],
+            _TWO_DIGIT[day],
+            _TWO_DIGIT[hour] if hour else 0,
+            _TWO_DIGIT[minute] if minute else 0,
+            _TWO_DIGIT[sec] if sec else 0,
+            int((usec or "").ljust(6, "0")),
             tz_obj,
         )
 
@@ -170,6 +224,49 @@ def parse_date(value):
     return parse_datetime(value).date()
 
 
+def _parse_duration_fast(value):
+    """Parse the common `PnYnMnDTnHnMnS` ISO 8601 duration format by a single
+    pass over the string, without the regular expression matching.
+    Returns `None` if the value is not in this format.
+    """
+    if value[:1] != "P":
+        return None
+    days, fsec = 0.0, 0.0
+    in_time = False
+    designators, coefficients = "YMD", (365, 30, 1)
+    next_designator = 0
+    start = 1  # start of the current number
+    for position in range(1, len(value)):
+        char = value[position]
+        if "0" <= char <= "9" or char == ".":
+            continue
+        if char == "T" and not in_time and position == start:
+            in_time = True
+            designators, coefficients = "HMS", (3600, 60, 1)
+            next_designator = 0
+            start = position + 1
+            continue
+        index = designators.find(char, next_designator)
+        number = value[start:position]
+        if (
+            index < 0
+            or not number
+            or number[0] == "."
+            or number[-1] == "."
+            or number.count(".") > 1
+        ):
+            return None
+        if in_time:
+            fsec += float(number) * coefficients[index]
+        else:
+            days += float(number) * coefficients[index]
+        next_designator = index + 1
+        start = position + 1
+    if start != len(value):
+        return None
+    return timedelta(days, fsec)
+
+
 def parse_duration(value):
     """Parses an ISO 8601 duration string into a python timedelta object.
     Raises a `ValueError` if the conversion was not possible.
@@ -177,6 +274,10 @@ def parse_duration(value):
     if isinstance(value, timedelta):
         return value
 
+    parsed_value = _parse_duration_fast(value)
+    if parsed_value is not None:
+        return parsed_value
+
     match = RE_ISO_8601_DURATION.match(value)
     if not match:
         raise ValueError("Could not parse ISO 8601 duration from '%s'." % value)
@@ -203,6 +304,11 @@ def encode_duration(value):
     # NOTE: The months and years are ambiguous and we do not encode them.
     if not isinstance(value, timedelta):
         raise ValueError("Invalid input type!")
+    # fast paths for the zero and whole-day intervals
+    if value == ZERO:
+        return "PT0S"
+    if value.days > 0 and value.seconds == 0 and value.microseconds == 0:
+        return f"P{value.days}D"
     items = []
     if value.days < 0:
         items.append("-")
@@ -213,8 +319,8 @@ def encode_duration(value):
     elif value.seconds == 0 and value.microseconds == 0:
         items.append("T0S")  # zero interval
     if value.seconds != 0 or value.microseconds != 0:
-        minutes, seconds = divmod(value.seconds, 60)
-        hours, minutes = divmod(minutes, 60)
+        hours, seconds = divmod(value.seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
         items.append("T")
         if hours != 0:
             items.append("%dH" % hours)
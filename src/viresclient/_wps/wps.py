@@ -29,16 +29,17 @@
 
 try:
     from urllib.error import HTTPError
-    from urllib.request import Request, urlopen
 except ImportError:
     # Python 2 backward compatibility
-    from urllib2 import urlopen, Request, HTTPError
+    from urllib2 import HTTPError
 
-from contextlib import closing
+from io import BytesIO
 from logging import LoggerAdapter, getLogger
 from time import sleep
+from weakref import finalize
 from xml.etree import ElementTree
 
+from .http_util import HeadersAuth, create_http_session
 from .time_util import Timer
 
 NS_OWS11 = "http://www.opengis.net/ows/1.1"
@@ -102,6 +103,14 @@ class WPS10Service:
         url     - service URL
         headers - optional dictionary of the HTTP headers sent with each
                   request
+        session - optional HTTP session (requests.Session) which can be
+                  shared by multiple service proxies
+
+    The headers (including the pre-encoded authentication) are passed with
+    each request rather than set on the session, as the session can be
+    shared by proxies with different credentials. Note that the cookie jar
+    of a shared session is shared as well. The sessions created by
+    create_http_session() do not store any cookies.
     """
 
     STATUS = {
@@ -115,18 +124,21 @@ class WPS10Service:
         def process(self, msg, kwargs):
             return "WPS10Service: %s" % msg, kwargs
 
-    def __init__(self, url, headers=None, logger=None):
+    def __init__(self, url, headers=None, logger=None, session=None):
         self.url = url
         self.headers = headers or {}
+        if session is None:
+            # private session closed together with the service proxy
+            session = create_http_session()
+            finalize(self, session.close)
+        self.session = session
         self.logger = self._LoggerAdapter(logger or getLogger(__name__), {})
 
     def retrieve(self, request, handler=None):
         """Send a synchronous POST WPS request to a server and retrieve
         the output.
         """
-        return self._retrieve(
-            Request(self.url, request, self.headers), handler, self.error_handler
-        )
+        return self._retrieve(self.url, request, handler, self.error_handler)
 
     def retrieve_async(
         self,
@@ -197,7 +209,7 @@ class WPS10Service:
         """Retrieve asynchronous job output reference."""
         self.logger.debug("Retrieving asynchronous job output '%s'.", output_name)
         output_url = self.parse_output_reference(status_url, output_name)
-        return self._retrieve(Request(output_url, None, self.headers), handler)
+        return self._retrieve(output_url, None, handler)
 
     @staticmethod
     def parse_output_reference(xml, identifier):
@@ -217,18 +229,12 @@ class WPS10Service:
         the status URL.
         """
         self.logger.debug("Submitting asynchronous job.")
-        return self._retrieve(
-            Request(self.url, request, self.headers),
-            self.parse_status,
-            self.error_handler,
-        )
+        return self._retrieve(self.url, request, self.parse_status, self.error_handler)
 
     def poll_status(self, status_url):
         """Poll status of an asynchronous WPS job."""
         self.logger.debug("Polling asynchronous job status.")
-        return self._retrieve(
-            Request(status_url, None, self.headers), self.parse_status
-        )
+        return self._retrieve(status_url, None, self.parse_status)
 
     @classmethod
     def parse_status(cls, response):
@@ -308,23 +314,42 @@ class WPS10Service:
         else:
             raise ElementTree.ParseError
 
-    def _retrieve(self, request, response_handler=None, error_handler=None):
-        """Retrieve and parse HTTP response."""
-        method = request.get_method()
-        url = request.get_full_url()
+    def _retrieve(self, url, data=None, response_handler=None, error_handler=None):
+        """Retrieve and parse HTTP response.
+        The request is sent as POST if data are provided or as GET otherwise.
+        """
+        method = "GET" if data is None else "POST"
         timer = Timer()
-        try:
-            with closing(urlopen(request)) as file_in:
-                output = (response_handler or self._default_handler)(file_in)
-            self.logger.info("%d %s %s %.3fs", 200, method, url, timer.elapsed_time)
-            return output
-        except HTTPError as error:
-            self.logger.error(
-                "%d %s %s %.3fs", error.code, method, url, timer.elapsed_time
-            )
-            if error_handler:
-                return error_handler(error)
-            raise
+        with self.session.request(
+            method, url, data=data, auth=HeadersAuth(self.headers), stream=True
+        ) as response:
+            file_in = response.raw
+            file_in.decode_content = True
+            if not response.ok:
+                self.logger.error(
+                    "%d %s %s %.3fs",
+                    response.status_code,
+                    method,
+                    url,
+                    timer.elapsed_time,
+                )
+                # NOTE: The body is read before the response gets closed
+                #       so that it remains readable from the raised error.
+                error = HTTPError(
+                    url,
+                    response.status_code,
+                    response.reason,
+                    response.headers,
+                    BytesIO(file_in.read()),
+                )
+                if error_handler:
+                    return error_handler(error)
+                raise error
+            output = (response_handler or self._default_handler)(file_in)
+        self.logger.info(
+            "%d %s %s %.3fs", response.status_code, method, url, timer.elapsed_time
+        )
+        return output
 
     def _default_cleanup_handler(self, status_url):
         pass
@@ -34,7 +34,7 @@ except ImportError:
 
 import re
 
-from .environment import JINJA2_ENVIRONMENT
+from .environment import get_template
 from .wps import WPS10Service
 
 RE_MATCH_JOB_ID = re.compile(
@@ -52,9 +52,11 @@ class ViresWPS10Service(WPS10Service):
             url     - service URL
             headers - optional dictionary of the HTTP headers sent with each
                       request
+            session - optional HTTP session (requests.Session) which can be
+                      shared by multiple service proxies
     """
 
-    template_remove_job = JINJA2_ENVIRONMENT.get_template("vires_remove_job.xml")
+    template_remove_job = get_template("vires_remove_job.xml")
 
     def _default_cleanup_handler(self, status_url):
         """Remove asynchronous job using the VirES specific interface."""
@@ -161,28 +161,39 @@ class ShowUploadsCommand(DataUploadCommand):
 
     @staticmethod
     def print_info(info):
-        print(info["identifier"])
-        print("  filename:     ", info["filename"])
-        print("  is valid:     ", info.get("is_valid", True))
-        print("  data start:   ", info["start"])
-        print("  data end:     ", info["end"])
-        print("  uploaded on:  ", info["created"])
-        print("  content type: ", info["content_type"])
-        print("  size:         ", info["size"])
-        print("  MD5 checksum: ", info["checksum"])
+        lines = [info["identifier"]]
+        lines.extend(
+            f"  {label:<14} {value}"
+            for label, value in [
+                ("filename:", info["filename"]),
+                ("is valid:", info.get("is_valid", True)),
+                ("data start:", info["start"]),
+                ("data end:", info["end"]),
+                ("uploaded on:", info["created"]),
+                ("content type:", info["content_type"]),
+                ("size:", info["size"]),
+                ("MD5 checksum:", info["checksum"]),
+            ]
+        )
 
         missing_fields = info.get("missing_fields", {})
         if missing_fields:
-            print("  missing mandatory fields:")
-            for field in sorted(list(missing_fields)):
-                print("    %s" % field)
+            lines.append("  missing mandatory fields:")
+            lines.extend("    %s" % field for field in sorted(list(missing_fields)))
 
         constant_fields = info.get("constant_fields", {})
         if constant_fields:
-            print("  constant fields:")
-            for field, data in sorted(constant_fields.items()):
-                print("    {}={}".format(field, data["value"]))
+            lines.append("  constant fields:")
+            lines.extend(
+                "    {}={}".format(field, data["value"])
+                for field, data in sorted(constant_fields.items())
+            )
+
+        lines.append("  fields:")
+        lines.extend(
+            "    %s" % field
+            for field in sorted(info.get("fields") or info.get("info") or [])
+        )
 
-        print("  fields:")
-        for field in sorted(info.get("fields") or info.get("info") or []):
-            print("    %s" % field)
+        # print all lines at once
+        print("\n".join(lines))
@@ -1,6 +1,17 @@
+import asyncio
+import gc
+import re
+import threading
+import time
+from functools import partial
+from io import BytesIO
+
+import pytest
+
 import viresclient
 from viresclient import AeolusRequest, SwarmRequest
-from viresclient._client import ClientRequest
+from viresclient._client import MAX_ASYNC_JOBS, ClientRequest
+from viresclient._wps.wps import WPSError
 
 
 def test_ClientRequest():
@@ -17,3 +28,127 @@ def test_ClientRequest():
     assert isinstance(
         request._wps_service, viresclient._wps.wps_vires.ViresWPS10Service
     )
+
+
+class FakeWPSService:
+    """WPS service proxy stub returning the request as the response body
+    and recording the peak number of concurrently processed requests.
+    """
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def retrieve(self, request, handler=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return handler(BytesIO(request))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def retrieve_async(self, request, handler=None, status_handler=None):
+        return self.retrieve(request, handler=handler)
+
+
+def _create_request():
+    request = SwarmRequest("http://127.0.0.1:1/ows", token="x")
+    request.set_collection("SW_OPER_MAGA_LR_1B")
+    request.set_products(measurements=["F"])
+    request._wps_service = FakeWPSService()
+    return request
+
+
+def _read_begin_times(retdata):
+    begin_times = []
+    for retdatafile in retdata.contents:
+        with open(retdatafile._file.name) as file_:
+            begin_times.append(re.search(r"\d{4}-\d\d-\d\dT", file_.read()).group())
+    return begin_times
+
+
+INTERVALS = [
+    (f"2016-01-{day:02d}T00:00:00Z", f"2016-01-{day:02d}T01:00:00Z")
+    for day in range(1, 7)
+]
+BEGIN_TIMES = [f"2016-01-{day:02d}T" for day in range(1, 7)]
+
+
+def test_get_between_async():
+    """Test that the asynchronous jobs of concurrent get_between_async()
+    and get_many() requests of multiple request objects are limited
+    and the results returned in order."""
+    request = _create_request()
+    other_request = _create_request()
+    # shared stub recording the peak number of jobs of both request objects
+    other_request._wps_service = request._wps_service
+
+    async def _get_all():
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            loop.run_in_executor(
+                None,
+                partial(
+                    other_request.get_many,
+                    INTERVALS,
+                    filetype="csv",
+                    show_progress=False,
+                ),
+            ),
+            *(
+                _request.get_between_async(start_time, end_time, filetype="csv")
+                for _request in (request, other_request)
+                for start_time, end_time in INTERVALS
+            ),
+        )
+
+    many_results, *results = asyncio.run(_get_all())
+    assert _read_begin_times(many_results) == BEGIN_TIMES
+    assert [_read_begin_times(retdata)[0] for retdata in results] == 2 * BEGIN_TIMES
+    assert request._wps_service.peak == MAX_ASYNC_JOBS
+    # the request inputs of the original object are unchanged
+    assert request._request_inputs.begin_time is None
+    assert request._request_inputs.end_time is None
+
+
+def test_get_many():
+    """Test that get_many() limits the concurrent requests and joins
+    the results in order."""
+    request = _create_request()
+    retdata = request.get_many(INTERVALS, filetype="csv", max_concurrency=3)
+    assert _read_begin_times(retdata) == BEGIN_TIMES
+    # the asynchronous jobs are capped to the server limit
+    assert request._wps_service.peak == MAX_ASYNC_JOBS
+    assert request._request_inputs.begin_time is None
+
+    request = _create_request()
+    retdata = request.get_many(
+        INTERVALS, filetype="csv", asynchronous=False, max_concurrency=3
+    )
+    assert _read_begin_times(retdata) == BEGIN_TIMES
+    assert request._wps_service.peak == 3
+
+
+# temporary files of the failed requests are released by the garbage collector
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+def test_get_many_error():
+    """Test that get_many() does not wait for the pending requests
+    once a request has failed."""
+    request = _create_request()
+    calls = []
+
+    def _retrieve(request, handler=None):
+        calls.append(request)
+        time.sleep(0.05)
+        raise WPSError("NoApplicableCode", None, "Failed!")
+
+    request._wps_service.retrieve = _retrieve
+    with pytest.raises(RuntimeError):
+        request.get_many(INTERVALS, filetype="csv", max_concurrency=1)
+    assert len(calls) < len(INTERVALS)
+    gc.collect()
@@ -0,0 +1,75 @@
+import datetime as dt
+
+import pytest
+
+from viresclient._wps.time_util import encode_duration, parse_datetime, parse_duration
+
+
+def test_parse_datetime():
+    """Test parsing of the ISO 8601 date-time strings
+
+    Time-zone aware inputs are converted to naive UTC date-times.
+    """
+    valid_inputs = {
+        "2016-01-01T00:00:00Z": dt.datetime(2016, 1, 1),
+        "2016-01-01T12:34:56.123456Z": dt.datetime(2016, 1, 1, 12, 34, 56, 123456),
+        "2016-01-01T12:34:56,5Z": dt.datetime(2016, 1, 1, 12, 34, 56, 500000),
+        "2016-01-01T12:34:56.1234567Z": dt.datetime(2016, 1, 1, 12, 34, 56, 123456),
+        "2016-01-01": dt.datetime(2016, 1, 1),
+        "2016-01-01T12:34": dt.datetime(2016, 1, 1, 12, 34),
+        "2016-01-01T12:34:56+05:30": dt.datetime(2016, 1, 1, 7, 4, 56),
+        "2016-01-01T12:34:56-05:30": dt.datetime(2016, 1, 1, 18, 4, 56),
+        "20160101T123456-0530": dt.datetime(2016, 1, 1, 18, 4, 56),
+        "20160101": dt.datetime(2016, 1, 1),
+    }
+    for value, expected in valid_inputs.items():
+        assert parse_datetime(value) == expected
+
+    # datetime objects are passed through
+    assert parse_datetime(dt.datetime(2016, 1, 1)) == dt.datetime(2016, 1, 1)
+
+    # The following should raise a ValueError:
+    for value in ["", "2016-13-01T00:00:00Z", "2016-01-01T00:00:00.12345aZ"]:
+        with pytest.raises(ValueError):
+            parse_datetime(value)
+
+
+def test_parse_duration():
+    """Test parsing of the ISO 8601 duration strings"""
+    valid_inputs = {
+        "PT1S": dt.timedelta(seconds=1),
+        "PT0.5S": dt.timedelta(seconds=0.5),
+        "PT1H30M": dt.timedelta(hours=1, minutes=30),
+        "P1D": dt.timedelta(days=1),
+        "P1MT1M": dt.timedelta(days=30, minutes=1),
+        "P1Y2M3DT4H5M6.5S": dt.timedelta(days=428, seconds=14706.5),
+        "P1H": dt.timedelta(hours=1),
+        "+P1D": dt.timedelta(days=1),
+    }
+    for value, expected in valid_inputs.items():
+        assert parse_duration(value) == expected
+
+    # timedelta objects are passed through
+    assert parse_duration(dt.timedelta(seconds=1)) == dt.timedelta(seconds=1)
+
+    # The following should raise a ValueError:
+    for value in ["", "P1", "P1D2Y", "PT.5S", "PT1.2.3S", "PT1M1M", "-P1D"]:
+        with pytest.raises(ValueError):
+            parse_duration(value)
+
+
+def test_encode_duration():
+    """Test encoding of timedelta objects as ISO 8601 duration strings"""
+    valid_inputs = {
+        dt.timedelta(0): "PT0S",
+        dt.timedelta(days=2): "P2D",
+        dt.timedelta(days=-2): "-P2D",
+        dt.timedelta(seconds=1): "PT1S",
+        dt.timedelta(hours=1, minutes=1, seconds=1): "PT1H1M1S",
+        dt.timedelta(days=1, seconds=0.5): "P1DT0.500000S",
+    }
+    for value, expected in valid_inputs.items():
+        assert encode_duration(value) == expected
+
+    with pytest.raises(ValueError):
+        encode_duration("PT1S")
@@ -0,0 +1,165 @@
+import gc
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+import requests
+
+from viresclient._client import ClientRequest
+from viresclient._data_handling import ReturnedDataFile
+from viresclient._wps import wps
+from viresclient._wps.http_util import create_http_session, encode_token_auth
+from viresclient._wps.wps import AuthenticationError, WPSError
+
+TEST_DATA = b"Timestamp,F\n" + b"2016-01-01T00:00:00Z,1.0\n" * 1000
+
+OWS_EXCEPTION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1" version="1.0.0">
+  <ows:Exception exceptionCode="InvalidParameterValue" locator="begin_time">
+    <ows:ExceptionText>Invalid time!</ows:ExceptionText>
+  </ows:Exception>
+</ows:ExceptionReport>"""
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Test server responses"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/gzip":
+            self._send(200, gzip.compress(TEST_DATA), {"Content-Encoding": "gzip"})
+        elif self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for offset in range(0, len(TEST_DATA), 4096):
+                chunk = TEST_DATA[offset : offset + 4096]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/echo":
+            # echo the received credentials
+            self._send(
+                200,
+                b"%s|%s"
+                % (
+                    (self.headers["Authorization"] or "").encode(),
+                    (self.headers["Cookie"] or "").encode(),
+                ),
+                {"Set-Cookie": "sessionid=secret; Path=/"},
+            )
+        elif self.path == "/not_found":
+            self._send(404, b"Not found!")
+        else:
+            self._send(200, TEST_DATA)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/auth":
+            self._send(401, b"Unauthorized!")
+        else:
+            self._send(400, OWS_EXCEPTION, {"Content-Type": "text/xml"})
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """Local HTTP server running in a background thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/plain", "/gzip", "/chunked"])
+@pytest.mark.parametrize("show_progress", [True, False])
+def test_retrieve_data(server_url, path, show_progress):
+    """Test that the data are downloaded (and decoded) to the file"""
+    request = ClientRequest(server_url + "/ows")
+    retdatafile = ReturnedDataFile(filetype="csv")
+    request._wps_service._retrieve(
+        server_url + path,
+        response_handler=request._response_handler(
+            retdatafile, show_progress=show_progress
+        ),
+    )
+    with open(retdatafile._file.name, "rb") as file_:
+        assert file_.read() == TEST_DATA
+    assert len(request._downloaded_chunk_sizes) == 1
+
+
+def test_retrieve_errors(server_url):
+    """Test handling of the HTTP error responses"""
+    request = ClientRequest(server_url + "/ows")
+    wps_service = request._wps_service
+
+    with pytest.raises(AuthenticationError):
+        wps_service._retrieve(
+            server_url + "/auth", b"<request/>", None, wps_service.error_handler
+        )
+
+    with pytest.raises(WPSError, match="InvalidParameterValue"):
+        wps_service._retrieve(
+            server_url + "/ows", b"<request/>", None, wps_service.error_handler
+        )
+
+    # the body of the raised error remains readable
+    with pytest.raises(HTTPError) as excinfo:
+        wps_service._retrieve(server_url + "/not_found")
+    assert excinfo.value.code == 404
+    assert excinfo.value.read() == b"Not found!"
+
+
+def test_private_session_closed(monkeypatch):
+    """Test that the private HTTP session is closed with the service proxy"""
+    closed = []
+
+    class Session(requests.Session):
+        def close(self):
+            closed.append(True)
+            super().close()
+
+    monkeypatch.setattr(wps, "create_http_session", Session)
+    service = wps.WPS10Service("http://127.0.0.1:1/ows")
+    del service
+    gc.collect()
+    assert closed == [True]
+
+    # shared sessions are left open
+    session = Session()
+    service = wps.WPS10Service("http://127.0.0.1:1/ows", session=session)
+    del service
+    gc.collect()
+    assert closed == [True]
+
+
+def test_retrieve_credentials(server_url, tmp_path, monkeypatch):
+    """Test that the configured credentials are sent instead of the ~/.netrc
+    ones and that no cookies are shared by the service proxies"""
+    netrc_path = tmp_path / "netrc"
+    netrc_path.write_text("machine 127.0.0.1 login user password secret\n")
+    monkeypatch.setenv("NETRC", str(netrc_path))
+
+    session = create_http_session()
+    service = wps.WPS10Service(
+        server_url + "/ows", encode_token_auth(token="TOKEN"), session=session
+    )
+    assert service._retrieve(server_url + "/echo") == b"Bearer TOKEN|"
+    assert service._retrieve(server_url + "/echo") == b"Bearer TOKEN|"
+
+    service = wps.WPS10Service(server_url + "/ows", session=session)
+    assert service._retrieve(server_url + "/echo") == b"|"